@@ -1,747 +1,1424 @@
-import subprocess
-import json
-import os
-import re
-from time import sleep
-import time
-import logging
-from typing import Optional, List, Dict, Any
-import sys
-import pygetwindow as gw
-from playsound import playsound
-from functools import lru_cache
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from models.openai import Gpt  
-from core.stt import telugu_speech_recognition
-from core.tts import telugu_speak
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-class AndroidDeviceError(Exception):
-    """Custom exception for Android device operations"""
-    pass
-
-class AndroidDevice:
-    def __init__(self, adb_path: Optional[str] = None, mobile_apps_path: Optional[str] = None):
-        """
-        Initialize AndroidDevice with configurable paths
-        
-        Args:
-            adb_path: Path to ADB executable
-            mobile_apps_path: Path to mobile apps JSON file
-        """
-        self.adb_path = adb_path or self._get_default_adb_path()
-        self.mobile_apps_path = mobile_apps_path or self._get_default_apps_path()
-        self.device_id: Optional[str] = None
-        self.installed_apps_cache: Dict[str, str] = {}
-
-        self._contacts_cache = {}
-        self._cache_expiry = 0
-        self.CACHE_DURATION = 300  # 5 minutes in seconds
-        
-        # Load mobile apps configuration
-        self._load_mobile_apps()
-        
-        # Initialize device connection
-        self._initialize_device()
-    
-    def _get_default_adb_path(self) -> str:
-        """Get default ADB path with cross-platform support"""
-        if os.name == 'nt':  # Windows
-            return os.path.join(os.getcwd(), 'assets', 'platform-tools', 'adb.exe')
-        else:  # Unix-like systems
-            return 'adb'  # Assume it's in PATH
-    
-    def _get_default_apps_path(self) -> str:
-        """Get default mobile apps JSON path"""
-        return os.path.join(os.getcwd(), 'auto', 'assets', 'mobile_apps.json')
-    
-    def _load_mobile_apps(self) -> None:
-        """Load mobile apps configuration from JSON file"""
-        try:
-            if os.path.exists(self.mobile_apps_path):
-                with open(self.mobile_apps_path, 'r', encoding='utf-8') as f:
-                    self.installed_apps_cache = json.load(f)
-                logger.info(f"Loaded {len(self.installed_apps_cache)} app configurations")
-            else:
-                logger.warning(f"Mobile apps file not found: {self.mobile_apps_path}")
-                self.installed_apps_cache = {}
-        except Exception as e:
-            logger.error(f"Error loading mobile apps configuration: {e}")
-            self.installed_apps_cache = {}
-    
-    def _initialize_device(self) -> None:
-        """Initialize device connection"""
-        try:
-            self.device_id = self.get_device_id()
-            if self.device_id:
-                logger.info(f"Connected to device: {self.device_id}")
-            else:
-                logger.warning("No device connected")
-        except Exception as e:
-            logger.error(f"Error initializing device: {e}")
-    
-    def _run_adb_command(self, command: List[str], capture_output: bool = True, 
-                        check: bool = True, timeout: int = 30) -> subprocess.CompletedProcess:
-        """
-        Run ADB command with error handling and timeout
-        
-        Args:
-            command: ADB command as list of strings
-            capture_output: Whether to capture output
-            check: Whether to raise exception on non-zero exit code
-            timeout: Command timeout in seconds
-        
-        Returns:
-            CompletedProcess object
-        """
-        full_command = [self.adb_path] + command
-        try:
-            result = subprocess.run(
-                full_command,
-                capture_output=capture_output,
-                text=True,
-                check=check,
-                timeout=timeout
-            )
-            return result
-        except subprocess.TimeoutExpired:
-            raise AndroidDeviceError(f"Command timed out after {timeout} seconds: {' '.join(full_command)}")
-        except subprocess.CalledProcessError as e:
-            raise AndroidDeviceError(f"ADB command failed: {e}")
-        except FileNotFoundError:
-            raise AndroidDeviceError(f"ADB executable not found: {self.adb_path}")
-        
-
-
-    def contacts(self) -> dict:
-        if not self.device_id:
-            raise AndroidDeviceError("No device connected")
-
-        try:
-            result = subprocess.run(
-                [self.adb_path, '-s', self.device_id, 'shell', 'content', 'query',
-                '--uri', 'content://contacts/phones/'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8'  # ✅ Ensure Unicode-safe decoding
-            )
-
-            print("returncode:", result.returncode)
-
-            if result.returncode != 0:
-                raise AndroidDeviceError(f"Failed to fetch contacts: {result.stderr}")
-
-            raw_output = result.stdout
-
-            contacts: dict[str, list[str]] = {}
-
-            for line in raw_output.strip().splitlines():
-                if line.startswith("Row:"):
-                    name, number = None, None
-                    parts = line.split(", ")
-                    for part in parts:
-                        if "display_name=" in part:
-                            name = part.split("display_name=")[1].strip()
-                        elif "number=" in part:
-                            number = part.split("number=")[1].strip()
-
-                    if name and number:
-                        # Add or append to dictionary
-                        if name in contacts:
-                            if number not in contacts[name]:
-                                contacts[name].append(number)
-                        else:
-                            contacts[name] = [number]
-
-            # ✅ Save to contacts.json with UTF-8 encoding
-            with open("assets/json/contacts.json", "w", encoding="utf-8") as f:
-                json.dump(contacts, f, indent=4, ensure_ascii=False)
-
-            print("✅ Contacts saved to contacts.json")
-            #return contacts
-
-        except Exception as e:
-            print(f"❌ Failed to fetch contacts: {e}")
-            return {}
-
-
-    def get_device_id(self) -> Optional[str]:
-        """Get the connected device ID with improved error handling"""
-        try:
-            result = self._run_adb_command(['devices'])
-            lines = result.stdout.strip().split('\n')
-            
-            # Find devices that are online
-            for line in lines[1:]:  # Skip header
-                if '\tdevice' in line:
-                    return line.split('\t')[0]
-            
-            logger.warning("No online devices found")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting device ID: {e}")
-            return None
-    
-    def connect_device(self, ip_address = "192.0.0.4"):
-        """Connect to the device via USB or Wi-Fi."""
-        try:
-            if ip_address:
-                subprocess.call([self.adb_path, 'kill-server'])
-                sleep(0.3)
-                subprocess.call([self.adb_path,'start-server'])
-                sleep(0.3)
-                subprocess.call([self.adb_path, 'tcpip', '5555'])
-                sleep(0.3)
-                subprocess.call([self.adb_path, 'connect', ip_address])
-                self.device_id = ip_address
-                return True
-            
-            else:
-                self.device_id = self.get_device_id()
-                return False
-            #print(f"Connected to device: {self.device_id}")
-        except Exception as e:
-            return f"Error connecting to device: {e}"
-    
-    def disconnect_device(self) -> bool:
-        """Disconnect the device with improved error handling"""
-        try:
-            self._run_adb_command(['disconnect'])
-            self.device_id = None
-            logger.info("Device disconnected successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Error disconnecting device: {e}")
-            return False
-    
-    def get_installed_apps(self) -> List[str]:
-        """Retrieve list of installed apps with caching"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            result = self._run_adb_command(['-s', self.device_id, 'shell', 'pm', 'list', 'packages'])
-            apps = [line.strip().replace('package:', '') for line in result.stdout.splitlines() if line.strip()]
-            
-            logger.info(f"Found {len(apps)} installed apps")
-            return apps
-        except Exception as e:
-            logger.error(f"Error retrieving installed apps: {e}")
-            return []
-    
-    def open_app(self, app_name: str) -> Optional[int]:
-        """
-        Open app with improved error handling and validation
-        
-        Args:
-            app_name: App name from configuration
-        
-        Returns:
-            Elapsed time in milliseconds if successful, None otherwise
-        """
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            if app_name not in self.installed_apps_cache:
-                raise AndroidDeviceError(f"App '{app_name}' not found in configuration")
-            
-            package_name = self.installed_apps_cache[app_name]
-            
-            result = self._run_adb_command([
-                '-s', self.device_id, 'shell', 'monkey', '-p', package_name.lower(),
-                '-c', 'android.intent.category.LAUNCHER', '1'
-            ])
-            
-            # Extract elapsed time
-            match = re.search(r"elapsed time=(\d+)ms", result.stdout)
-            if match:
-                elapsed_time = int(match.group(1))
-                logger.info(f"App '{app_name}' opened successfully in {elapsed_time}ms")
-                return True
-            else:
-                logger.info(f"App '{app_name}' opened successfully")
-                return True
-                
-        except Exception as e:
-            logger.error(f"Error opening app '{app_name}': {e}")
-            return False
-    
-    def close_app(self, app_name: str) -> bool:
-        """Close app with improved error handling"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            if app_name not in self.installed_apps_cache:
-                raise AndroidDeviceError(f"App '{app_name}' not found in configuration")
-            
-            package_name = self.installed_apps_cache[app_name]
-            self._run_adb_command(['-s', self.device_id, 'shell', 'am', 'force-stop', package_name])
-            
-            logger.info(f"Closed app: {app_name}")
-            return True
-        except Exception as e:
-            logger.error(f"Error closing app '{app_name}': {e}")
-            return False
-    
-    def get_network_status(self) -> Dict[str, Any]:
-        """Get comprehensive network status information"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            # Check connectivity
-            try:
-                result = self._run_adb_command(['-s', self.device_id, 'shell', 'ping', '-c', '1', '8.8.8.8'])
-                internet_connected = result.returncode == 0
-            except:
-                internet_connected = False
-            
-            # Get network info
-            network_info = self._run_adb_command(['-s', self.device_id, 'shell', 'dumpsys', 'connectivity'])
-            
-            status = {
-                'internet_connected': internet_connected,
-                'wifi_enabled': 'Wi-Fi' in network_info.stdout and 'CONNECTED' in network_info.stdout,
-                'mobile_data_enabled': 'mobile' in network_info.stdout.lower() and 'CONNECTED' in network_info.stdout,
-                'raw_info': network_info.stdout
-            }
-            
-            return status
-        except Exception as e:
-            logger.error(f"Error checking network status: {e}")
-            return {'error': str(e)}
-    
-    def toggle_wifi(self, enable: bool = True) -> bool:
-        """Toggle WiFi with clearer parameter naming"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            action = 'enable' if enable else 'disable'
-            self._run_adb_command(['-s', self.device_id, 'shell', 'svc', 'wifi', action])
-            
-            logger.info(f"Wi-Fi {'enabled' if enable else 'disabled'}")
-            return True
-        except Exception as e:
-            logger.error(f"Error toggling Wi-Fi: {e}")
-            return False
-    
-    def toggle_bluetooth(self, enable: bool = True) -> bool:
-        """Toggle Bluetooth with clearer parameter naming"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            action = 'enable' if enable else 'disable'
-            self._run_adb_command(['-s', self.device_id, 'shell', 'svc', 'bluetooth', action])
-            
-            logger.info(f"Bluetooth {'enabled' if enable else 'disabled'}")
-            return True
-        except Exception as e:
-            logger.error(f"Error toggling Bluetooth: {e}")
-            return False
-    
-    def toggle_mobile_data(self, enable: bool = True) -> bool:
-        """Toggle mobile data with clearer parameter naming"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            action = 'enable' if enable else 'disable'
-            self._run_adb_command(['-s', self.device_id, 'shell', 'svc', 'data', action])
-            
-            logger.info(f"Mobile data {'enabled' if enable else 'disabled'}")
-            return True
-        except Exception as e:
-            logger.error(f"Error toggling mobile data: {e}")
-            return False
-    
-    def take_screenshot(self, file_path: str = "screenshot.png", local_path: Optional[str] = None) -> bool:
-        """
-        Take screenshot with improved path handling
-        
-        Args:
-            file_path: Remote file path on device
-            local_path: Local file path (defaults to current directory)
-        
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            remote_path = f"/sdcard/{file_path}"
-            local_file = local_path or file_path
-            
-            # Take screenshot
-            self._run_adb_command(['-s', self.device_id, 'shell', 'screencap', '-p', remote_path])
-            
-            # Pull screenshot to local device
-            self._run_adb_command(['-s', self.device_id, 'pull', remote_path, local_file])
-            
-            # Clean up remote file
-            self._run_adb_command(['-s', self.device_id, 'shell', 'rm', remote_path], check=False)
-            
-            logger.info(f"Screenshot saved to: {local_file}")
-            return True
-        except Exception as e:
-            logger.error(f"Error taking screenshot: {e}")
-            return False
-    
-    def make_call(self, contact_name: str) -> bool:
-        """
-        Make a phone call using contact name from saved contacts.json
-        Automatically cleans phone number (removes +91 and spaces).
-        """
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-
-            contacts_file = "assets\\json\\contacts.json"
-            if not os.path.exists(contacts_file):
-                raise AndroidDeviceError("contacts.json not found. Please fetch and save contacts first.")
-
-            with open(contacts_file, "r", encoding="utf-8") as f:
-                contacts = json.load(f)
-
-            # 🔍 Match contact name (case-insensitive)
-            matched_name = next((name for name in contacts if name.lower() == contact_name.lower()), None)
-            if not matched_name:
-                raise AndroidDeviceError(f"No contact found with name '{contact_name}'.")
-
-            phone_numbers = contacts[matched_name]
-            if isinstance(phone_numbers, list):
-                phone_number = phone_numbers[0]
-            else:
-                phone_number = phone_numbers
-
-            # 🧼 Clean number: remove spaces and "+91" if present
-            phone_number = phone_number.replace(" ", "").replace("+91", "")
-            
-            # ✅ Validate cleaned number
-            if not re.match(r'^\d{10}$', phone_number):
-                raise AndroidDeviceError(f"Invalid phone number after cleanup: {phone_number}")
-
-            logger.info(f"📞 Dialing {matched_name}: {phone_number}")
-
-            self._run_adb_command([
-                '-s', self.device_id, 'shell', 'am', 'start',
-                '-a', 'android.intent.action.CALL',
-                '-d', f'tel:{phone_number}'
-            ])
-
-            logger.info(f"✅ Call initiated to {matched_name} ({phone_number})")
-            return True
-
-        except Exception as e:
-            logger.error(f"❌ Error making call: {e}")
-            return False
-        
-    def get_battery_status(self) -> Dict[str, Any]:
-        """Get comprehensive battery status information"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            result = self._run_adb_command(['-s', self.device_id, 'shell', 'dumpsys', 'battery'])
-            battery_info = result.stdout
-            
-            # Parse battery information
-            status = {}
-            for line in battery_info.split('\n'):
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip().lower().replace(' ', '_')
-                    value = value.strip()
-                    
-                    if key == 'level':
-                        status['battery_level'] = int(value)
-                    elif key == 'voltage':
-                        status['voltage_mv'] = int(value)
-                    elif key == 'temperature':
-                        status['temperature_celsius'] = int(value) / 10
-                    elif key in ['usb_powered', 'ac_powered', 'wireless_powered']:
-                        status[key] = value.lower() == 'true'
-                    elif key == 'status':
-                        status['charging_status'] = value
-            
-            # Determine overall charging state
-            status['is_charging'] = any([
-                status.get('usb_powered', False),
-                status.get('ac_powered', False),
-                status.get('wireless_powered', False)
-            ])
-            
-            return status
-        except Exception as e:
-            logger.error(f"Error getting battery status: {e}")
-            return {'error': str(e)}
-    
-    def get_device_info(self) -> Dict[str, str]:
-        """Get comprehensive device information"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            info = {}
-            
-            # Get various device properties
-            properties = [
-                ('brand', 'ro.product.brand'),
-                ('model', 'ro.product.model'),
-                ('version', 'ro.build.version.release'),
-                ('sdk', 'ro.build.version.sdk'),
-                ('manufacturer', 'ro.product.manufacturer'),
-                ('serial', 'ro.serialno')
-            ]
-            
-            for key, prop in properties:
-                try:
-                    result = self._run_adb_command(['-s', self.device_id, 'shell', 'getprop', prop])
-                    info[key] = result.stdout.strip()
-                except:
-                    info[key] = 'Unknown'
-            
-            return info
-        except Exception as e:
-            logger.error(f"Error getting device info: {e}")
-            return {'error': str(e)}
-    
-    def send_text(self, text: str) -> bool:
-        """Send text input to device"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            # Escape special characters
-            escaped_text = text.replace(' ', '%s').replace('&', '\\&')
-            
-            self._run_adb_command(['-s', self.device_id, 'shell', 'input', 'text', escaped_text])
-            logger.info(f"Sent text: {text}")
-            return True
-        except Exception as e:
-            logger.error(f"Error sending text: {e}")
-            return False
-    
-    def send_keyevent(self, keycode: int) -> bool:
-        """Send keyevent to device"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            self._run_adb_command(['-s', self.device_id, 'shell', 'input', 'keyevent', str(keycode)])
-            logger.info(f"Sent keyevent: {keycode}")
-            return True
-        except Exception as e:
-            logger.error(f"Error sending keyevent: {e}")
-            return False
-    
-    def tap_screen(self, x: int, y: int) -> bool:
-        """Tap screen at coordinates"""
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-            
-            self._run_adb_command(['-s', self.device_id, 'shell', 'input', 'tap', str(x), str(y)])
-            logger.info(f"Tapped screen at ({x}, {y})")
-            return True
-        except Exception as e:
-            logger.error(f"Error tapping screen: {e}")
-            return False
-        
-    def unlock_device(self):
-        try:
-            self.send_keyevent(26)
-            sleep(0.9)
-            self._run_adb_command(['-s', self.device_id, 'shell', 'input', 'swipe', '400 1000 500 300'])
-            sleep(0.6)
-            self.send_text('3803')
-            return True
-        except:
-            return f"Error in Unlock the device"
-
-    def _get_incoming_number(self):
-        """Fetch incoming call number using ADB"""
-        result = subprocess.run(
-            [self.adb_path, "shell", "dumpsys", "telephony.registry"],
-            capture_output=True,
-            text=True
-        )
-        # Search for the incoming call number in the output
-        for line in result.stdout.split("\n"):
-            if "mCallIncomingNumber" in line:
-                return line.split("=")[-1].strip()  # Extract and return the number
-        return None
-
-    def monitor_incoming_calls(self):
-        print("Monitoring incoming calls...")
-        last_number = None
-
-        while True:
-            incoming_number = AndroidDevice()._get_incoming_number()
-            if incoming_number and incoming_number != last_number:
-                last_number = incoming_number
-                print(f"Incoming Call from: {incoming_number}")
-                if incoming_number:
-                    break
-                return incoming_number
-
-            sleep(3)  # Check every 3 seconds
-
-    def get_contacts(self, force_refresh: bool = False) -> Dict[str, str | List[str]]:
-        """
-        Retrieve contacts from the connected Android device using ADB.
-
-        Args:
-            force_refresh: Whether to ignore cache and fetch fresh.
-
-        Returns:
-            Dictionary of {contact_name: phone_number or [multiple_numbers]}
-        """
-        try:
-            if not self.device_id:
-                raise AndroidDeviceError("No device connected")
-
-            current_time = time.time()
-            if not force_refresh and self._contacts_cache and current_time < self._cache_expiry:
-                logger.info("Using cached contacts")
-                return self._contacts_cache
-
-            logger.info("Fetching contacts from device...")
-            result = self._run_adb_command([
-                '-s', self.device_id, 'shell', 'content', 'query',
-                '--uri', 'content://com.android.contacts/data',
-                '--projection', 'display_name:data1:mimetype',
-                '--where', "mimetype='vnd.android.cursor.item/phone_v2'"
-            ])
-
-            output = result.stdout.strip()
-            if not output:
-                logger.warning("No contacts found or access denied.")
-                return {}
-
-            contacts = {}
-
-            for line in output.splitlines():
-                if line.startswith("Row"):
-                    name_match = re.search(r'display_name=([^,]+)', line)
-                    phone_match = re.search(r'data1=([^,]+)', line)
-
-                    if name_match and phone_match:
-                        name = name_match.group(1).strip().strip('"\'')
-                        phone = phone_match.group(1).strip().strip('"\'')
-                        
-                        if name and phone and name != 'NULL' and phone != 'NULL':
-                            if name in contacts:
-                                if isinstance(contacts[name], list):
-                                    contacts[name].append(phone)
-                                else:
-                                    contacts[name] = [contacts[name], phone]
-                            else:
-                                contacts[name] = phone
-
-            self._contacts_cache = contacts
-            self._cache_expiry = current_time + self.CACHE_DURATION
-            logger.info(f"Retrieved {len(contacts)} contacts")
-
-            return contacts
-
-        except Exception as e:
-            logger.error(f"Error retrieving contacts: {e}")
-            return {}
-
-   
-    def call_assistant_mobile(self, action: bool):
-        print("📞 [AI Assistant] Monitoring for incoming calls...")
-
-        last_number = None
-
-        while True:
-            try:
-                incoming_number = self._get_incoming_number()
-
-                # Skip if no call or same number
-                if not incoming_number or incoming_number == last_number:
-                    sleep(2)
-                    continue
-
-                print(f"📲 Incoming call from: {incoming_number}")
-                last_number = incoming_number
-
-                # STEP 1: Answer the call
-                if action == True:
-                    try:
-                        print("📞 Answering the call via ADB...")
-                        sleep(3)
-                        self._run_adb_command(["-s", self.device_id, "shell", "input", "keyevent", "79"])
-                        print("✅ Call answered.")
-                    except Exception as e:
-                        print(f"❌ Failed to answer call: {e}")
-                        continue
-
-                    sleep(1)  # Give time for call audio to route
-                    print("🧠 Starting AI conversation...")
-
-                    # STEP 2: AI assistant loop
-                    playsound("assets/aud/Intro.mp3")
-                    sleep(0.5)
-                    
-                    playsound("assets/aud/first_commit.mp3")
-                    first_commit = telugu_speech_recognition()
-                    print(f"First Commit {first_commit}")
-                    if "yes" in first_commit:
-                        playsound("assets/aud/bye.mp3")
-
-                        while True:
-                            user_input = telugu_speech_recognition()
-
-                            if not user_input:
-                                silence_counter += 1
-                                if silence_counter >= 3:
-                                    print("🤐 Too much silence. Ending session.")
-                                    break
-                                continue
-                            silence_counter = 0  # reset on valid input
-
-                            print(f"🗣️ User: {user_input}")
-                            ai_reply = Gpt(user_input, "You are a helpful Telugu-speaking call assistant.")
-                            print(f"🤖 AI: {ai_reply}")
-                            telugu_speak(ai_reply)
-
-                            if any(x in user_input.lower() for x in ["bye", "చాలు", "stop", "వెళ్లాలి"]):
-                                print("👋 Ending AI session for this call.")
-                                break
-
-                        print("🔄 Waiting for next call...\n")
-                        sleep(5)
-
-                    if "no" in first_commit:
-                        print("👋 User declined assistant. Resetting for next call...")
-                        last_number = None  # Allow future calls from same number
-                        continue
-
-                if action == False:
-                    continue
-
-            except KeyboardInterrupt:
-                print("\n👋 Stopped monitoring by user.")
-                break
-            except Exception as e:
-                print(f"⚠️ Unexpected error: {e}")
-                sleep(5)
-
-
-# Example usage and testing
-if __name__ == "__main__":
-    device = AndroidDevice()
-    device.connect_device()
-
+import subprocess
+import json
+import os
+import re
+import atexit
+import hashlib
+import queue
+import sqlite3
+import asyncio
+import selectors
+import shutil
+import threading
+from time import sleep
+import time
+import logging
+from typing import Optional, List, Dict, Any
+import sys
+import pygetwindow as gw
+from playsound import playsound
+from functools import lru_cache, wraps
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.openai import Gpt  
+from core.stt import telugu_speech_recognition
+from core.tts import telugu_speak
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Pre-compiled patterns shared by the parsing hot paths
+_ELAPSED_RE = re.compile(r"elapsed time=(\d+)ms")
+_GETPROP_RE = re.compile(r'^\[([^\]]+)\]: \[([^\]]*)\]', re.M)
+_SHELL_END_RE = re.compile(r'__END__(\d+)__')
+_NET_TRANSPORTS_RE = re.compile(r'Active default network:.*?Transports:\s*([^\n]+)', re.S)
+_ROW_RE = re.compile(r'display_name=([^,]*),.*?data1=([^,]*?)(?:,|$)', re.M)
+_INCOMING_RE = re.compile(r'mCallIncomingNumber[=:]\s*(\+?\d+)')
+_RINGING_RE = re.compile(r'\bRINGING\b|notifyCallState.*?\bstate[=: ]+1\b', re.I)
+_DEVICE_RE = re.compile(r'^(\S+)\tdevice\b', re.M)
+_BATT_RE = re.compile(
+    r'^\s*(level|voltage|temperature|USB powered|AC powered|Wireless powered|status)\s*:\s*(\S+)',
+    re.M | re.I)
+
+# Deletion table for phone-number cleanup (spaces and the '+' prefix)
+_PHONE_STRIP = str.maketrans('', '', ' +')
+
+# One-pass escape table for `input text`: spaces become %s and every
+# shell metacharacter gets backslash-escaped
+_INPUT_TRANSLATE = str.maketrans({
+    ' ': '%s', '&': '\\&', "'": "\\'", '"': '\\"', '<': '\\<', '>': '\\>',
+    '`': '\\`', '$': '\\$', '(': '\\(', ')': '\\)', ';': '\\;', '|': '\\|'
+})
+
+class AndroidDeviceError(Exception):
+    """Custom exception for Android device operations"""
+    pass
+
+@lru_cache(maxsize=1)
+def _resolve_adb() -> str:
+    """Resolve the adb executable once: env override, PATH, then bundled copy"""
+    return (os.environ.get('ADB_PATH')
+            or shutil.which('adb')
+            or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'assets', 'platform-tools',
+                            'adb.exe' if os.name == 'nt' else 'adb'))
+
+@lru_cache(maxsize=1)
+def _default_apps_path() -> str:
+    """Resolve the default mobile apps JSON path once, anchored at this file"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'auto', 'assets', 'mobile_apps.json')
+
+_RAISE = object()
+
+def requires_device(fn=None, *, failure=_RAISE):
+    """
+    Decorator guarding methods that need a connected device
+
+    Used bare it raises AndroidDeviceError when no device is connected.
+    With `failure` given, it instead logs the error and returns that value
+    (calling it first if callable), preserving each public method's
+    log-and-return-failure contract.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if self.device_id is None:
+                if failure is _RAISE:
+                    raise AndroidDeviceError("No device connected")
+                logger.error(f"Error in {fn.__name__}: No device connected")
+                return failure() if callable(failure) else failure
+            return fn(self, *args, **kwargs)
+        return wrapper
+
+    if fn is not None:
+        return decorator(fn)
+    return decorator
+
+class _LazyResult:
+    """
+    CompletedProcess look-alike that defers stdout/stderr decoding
+
+    subprocess is run in bytes mode; the UTF-8 decode only happens if a
+    caller actually reads .stdout/.stderr, so commands whose output is
+    ignored (toggles, taps, keyevents) skip the decode pass entirely.
+    """
+
+    __slots__ = ('args', 'returncode', '_stdout_bytes', '_stderr_bytes',
+                 '_stdout', '_stderr')
+
+    def __init__(self, args, returncode: int,
+                 stdout: Optional[bytes], stderr: Optional[bytes]):
+        self.args = args
+        self.returncode = returncode
+        self._stdout_bytes = stdout
+        self._stderr_bytes = stderr
+        self._stdout: Optional[str] = None
+        self._stderr: Optional[str] = None
+
+    @property
+    def stdout(self) -> Optional[str]:
+        if self._stdout is None and self._stdout_bytes is not None:
+            self._stdout = self._stdout_bytes.decode('utf-8', 'replace')
+        return self._stdout
+
+    @property
+    def stderr(self) -> Optional[str]:
+        if self._stderr is None and self._stderr_bytes is not None:
+            self._stderr = self._stderr_bytes.decode('utf-8', 'replace')
+        return self._stderr
+
+class InputBatch:
+    """
+    Queue input operations and flush them as a single adb shell call
+
+    Each tap/keyevent/text normally pays a full adb round trip. Using the
+    batch as a context manager joins the queued commands with ';' so the
+    whole sequence costs one invocation:
+
+        with device.input_batch() as batch:
+            batch.tap(100, 200)
+            batch.sleep_ms(500)
+            batch.key(66)
+    """
+
+    def __init__(self, device: 'AndroidDevice'):
+        self.device = device
+        self._ops: List[str] = []
+
+    def tap(self, x: int, y: int) -> 'InputBatch':
+        self._ops.append(f'input tap {x} {y}')
+        return self
+
+    def key(self, keycode: int) -> 'InputBatch':
+        self._ops.append(f'input keyevent {keycode}')
+        return self
+
+    def text(self, text: str) -> 'InputBatch':
+        self._ops.append(f'input text {text.translate(_INPUT_TRANSLATE)}')
+        return self
+
+    def swipe(self, x1: int, y1: int, x2: int, y2: int, duration_ms: Optional[int] = None) -> 'InputBatch':
+        cmd = f'input swipe {x1} {y1} {x2} {y2}'
+        if duration_ms is not None:
+            cmd += f' {duration_ms}'
+        self._ops.append(cmd)
+        return self
+
+    def sleep_ms(self, ms: int) -> 'InputBatch':
+        self._ops.append(f'sleep {ms / 1000}')
+        return self
+
+    def flush(self) -> None:
+        """Send all queued operations in one shell invocation"""
+        if self._ops:
+            self.device.run_script(self._ops)
+            self._ops = []
+
+    def __enter__(self) -> 'InputBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+class AndroidDevice:
+    def __init__(self, adb_path: Optional[str] = None, mobile_apps_path: Optional[str] = None):
+        """
+        Initialize AndroidDevice with configurable paths
+        
+        Args:
+            adb_path: Path to ADB executable
+            mobile_apps_path: Path to mobile apps JSON file
+        """
+        self.adb_path = adb_path or self._get_default_adb_path()
+        self.mobile_apps_path = mobile_apps_path or self._get_default_apps_path()
+        self.device_id: Optional[str] = None
+        self.apps_db_path = os.path.join(os.path.dirname(self.mobile_apps_path), 'apps.db')
+        self._apps_conn: Optional[sqlite3.Connection] = None
+        self._app_pkg_cache: Dict[str, Optional[str]] = {}
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_queue: Optional[queue.Queue] = None
+        self._shell_stderr_queue: Optional[queue.Queue] = None
+        self._atexit_registered = False
+        self._shell_lock = threading.Lock()
+        self._shell_prefix: List[str] = []
+        self._host_prefix: List[str] = []
+        self._current_transport: Optional[str] = None
+
+        self._contacts_cache = {}
+        self._cache_expiry = 0
+        self.CACHE_DURATION = 300  # 5 minutes in seconds
+
+        self._contacts_file_cache: Optional[tuple] = None  # (mtime, contacts, lower_index)
+        self._contacts_json_hash: Optional[str] = None
+        self._info_cache: Optional[Dict[str, str]] = None
+        self._props_cache: Optional[Dict[str, str]] = None
+        self._props_ts = 0.0
+        self.PROPS_CACHE_DURATION = 60  # seconds
+        self._installed_apps: Optional[List[str]] = None
+        self._installed_apps_ts = 0.0
+        
+        # Load mobile apps configuration
+        self._load_mobile_apps()
+        
+        # Initialize device connection
+        self._initialize_device()
+    
+    def _get_default_adb_path(self) -> str:
+        """Get default ADB path with cross-platform support"""
+        return _resolve_adb()
+    
+    def _get_default_apps_path(self) -> str:
+        """Get default mobile apps JSON path"""
+        return _default_apps_path()
+    
+    def _load_mobile_apps(self) -> None:
+        """Open the SQLite-backed app store, migrating from mobile_apps.json if needed"""
+        try:
+            self._apps_conn = sqlite3.connect(self.apps_db_path)
+            self._apps_conn.execute('PRAGMA mmap_size=268435456')
+            self._apps_conn.execute('PRAGMA journal_mode=WAL')
+            self._apps_conn.execute('CREATE TABLE IF NOT EXISTS apps(name TEXT PRIMARY KEY, package TEXT)')
+
+            # One-shot migration from the legacy JSON configuration
+            count = self._apps_conn.execute('SELECT COUNT(*) FROM apps').fetchone()[0]
+            if count == 0:
+                try:
+                    # Open directly; catching FileNotFoundError avoids the
+                    # exists()+open() double stat and its TOCTOU window
+                    with open(self.mobile_apps_path, 'rb') as f:
+                        apps = _loads(f.read())
+                except FileNotFoundError:
+                    logger.warning(f"Mobile apps file not found: {self.mobile_apps_path}")
+                    return
+                # Store packages pre-lowered so open_app need not lower per launch
+                self._apps_conn.executemany(
+                    'INSERT OR REPLACE INTO apps(name, package) VALUES (?, ?)',
+                    [(name, package.lower()) for name, package in apps.items()]
+                )
+                self._apps_conn.commit()
+                logger.info(f"Migrated {len(apps)} app configurations to {self.apps_db_path}")
+            else:
+                logger.info(f"Loaded app store with {count} app configurations")
+        except Exception as e:
+            logger.error(f"Error loading mobile apps configuration: {e}")
+            self._apps_conn = None
+
+    def _get_app_package(self, app_name: str) -> Optional[str]:
+        """Look up an app's package name from the SQLite app store (case-insensitive)"""
+        key = app_name.lower()
+        if key in self._app_pkg_cache:
+            return self._app_pkg_cache[key]
+        if self._apps_conn is None:
+            return None
+        row = self._apps_conn.execute(
+            'SELECT package FROM apps WHERE name=? COLLATE NOCASE', (app_name,)).fetchone()
+        package = row[0] if row else None
+        self._app_pkg_cache[key] = package
+        return package
+    
+    def _initialize_device(self) -> None:
+        """Initialize device connection"""
+        try:
+            self.device_id = self.get_device_id()
+            if self.device_id:
+                logger.info(f"Connected to device: {self.device_id}")
+                self._host_prefix = ['-s', self.device_id]
+                self._shell_prefix = self._host_prefix + ['shell']
+                self._start_shell()
+            else:
+                logger.warning("No device connected")
+        except Exception as e:
+            logger.error(f"Error initializing device: {e}")
+
+    def _start_shell(self) -> None:
+        """Start a persistent `adb shell` session to avoid per-command spawn overhead"""
+        try:
+            self._shell = subprocess.Popen(
+                [self.adb_path, '-s', self.device_id, 'shell'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+            # Daemon readers feed stdout/stderr lines into queues so sentinel
+            # reads can honor a deadline instead of blocking in readline(),
+            # and stderr stays out of the sentinel parser's input
+            self._shell_queue = queue.Queue()
+            self._shell_stderr_queue = queue.Queue()
+            threading.Thread(
+                target=self._drain_shell_stream,
+                args=(self._shell.stdout, self._shell_queue),
+                daemon=True
+            ).start()
+            threading.Thread(
+                target=self._drain_shell_stream,
+                args=(self._shell.stderr, self._shell_stderr_queue),
+                daemon=True
+            ).start()
+            # Register once: shell restarts would otherwise stack
+            # registrations, each pinning this instance until exit
+            if not self._atexit_registered:
+                atexit.register(self.close_shell)
+                self._atexit_registered = True
+            logger.info("Persistent adb shell session started")
+        except Exception as e:
+            logger.error(f"Error starting persistent shell: {e}")
+            self._shell = None
+
+    @staticmethod
+    def _drain_shell_stream(stream, out_queue: 'queue.Queue') -> None:
+        """Forward persistent-shell output lines into a queue; None marks EOF"""
+        for line in stream:
+            out_queue.put(line)
+        out_queue.put(None)
+
+    def close_shell(self) -> None:
+        """Close the persistent shell session if it is running"""
+        if self._shell is not None:
+            try:
+                if self._shell.stdin:
+                    self._shell.stdin.close()
+                self._shell.wait(timeout=5)
+            except Exception:
+                self._shell.kill()
+            finally:
+                self._shell = None
+
+    def __del__(self):
+        try:
+            self.close_shell()
+            if self._apps_conn is not None:
+                self._apps_conn.close()
+        except Exception:
+            pass
+
+    def _shell_exec(self, cmd: str, timeout: int = 30) -> subprocess.CompletedProcess:
+        """
+        Execute a command on the persistent shell session
+
+        Writes the command followed by a sentinel echo and reads stdout until
+        the sentinel appears, so output and exit status can be recovered
+        without spawning a new adb process.
+
+        Args:
+            cmd: Shell command string to execute on the device
+            timeout: Command timeout in seconds
+
+        Returns:
+            CompletedProcess object with stdout and returncode populated
+        """
+        with self._shell_lock:
+            if self._shell is None or self._shell.poll() is not None:
+                self._start_shell()
+            if self._shell is None:
+                raise AndroidDeviceError("Persistent shell session unavailable")
+
+            try:
+                self._shell.stdin.write(f"{cmd}; echo __END__$?__\n")
+                self._shell.stdin.flush()
+
+                deadline = time.monotonic() + timeout
+                output_lines = []
+                returncode = 0
+                while True:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        line = self._shell_queue.get(timeout=max(0.0, remaining))
+                    except queue.Empty:
+                        # Hung device command: kill the wedged shell so the
+                        # next call gets a fresh session
+                        self._shell.kill()
+                        self.close_shell()
+                        raise AndroidDeviceError(
+                            f"Command timed out after {timeout} seconds: {cmd}")
+                    if line is None:  # EOF - shell died
+                        self.close_shell()
+                        raise AndroidDeviceError("Persistent shell session closed unexpectedly")
+                    match = _SHELL_END_RE.search(line)
+                    if match:
+                        # Output without a trailing newline shares the
+                        # sentinel's line; keep the part before the marker
+                        if match.start() > 0:
+                            output_lines.append(line[:match.start()])
+                        returncode = int(match.group(1))
+                        break
+                    output_lines.append(line)
+
+                # Collect whatever stderr has accumulated while the command ran
+                stderr_lines = []
+                while True:
+                    try:
+                        err = self._shell_stderr_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if err is None:
+                        break
+                    stderr_lines.append(err)
+
+                return subprocess.CompletedProcess(
+                    args=cmd, returncode=returncode,
+                    stdout=''.join(output_lines), stderr=''.join(stderr_lines)
+                )
+            except AndroidDeviceError:
+                raise
+            except Exception as e:
+                self.close_shell()
+                raise AndroidDeviceError(f"Persistent shell command failed: {e}")
+
+    def _run_adb_command(self, command: List[str], capture_output: bool = True,
+                        check: bool = True, timeout: int = 30,
+                        binary: bool = False) -> subprocess.CompletedProcess:
+        """
+        Run ADB command with error handling and timeout
+
+        Args:
+            command: ADB command as list of strings
+            capture_output: Whether to capture output
+            check: Whether to raise exception on non-zero exit code
+            timeout: Command timeout in seconds
+            binary: Whether to return raw bytes instead of decoded text
+
+        Returns:
+            CompletedProcess object
+        """
+        # Route device shell commands through the persistent session when possible
+        if (len(command) > 3 and command[0] == '-s' and command[1] == self.device_id
+                and command[2] == 'shell' and capture_output and not binary):
+            try:
+                result = self._shell_exec(' '.join(command[3:]), timeout=timeout)
+                if check and result.returncode != 0:
+                    raise AndroidDeviceError(
+                        f"Shell command failed with exit code {result.returncode}: {' '.join(command[3:])}")
+                return result
+            except AndroidDeviceError:
+                raise
+
+        full_command = [self.adb_path] + command
+        try:
+            result = subprocess.run(
+                full_command,
+                capture_output=capture_output,
+                check=check,
+                timeout=timeout
+            )
+            if binary:
+                return result
+            # Keep bytes and decode lazily on first stdout/stderr access
+            return _LazyResult(result.args, result.returncode,
+                               result.stdout, result.stderr)
+        except subprocess.TimeoutExpired:
+            raise AndroidDeviceError(f"Command timed out after {timeout} seconds: {' '.join(full_command)}")
+        except subprocess.CalledProcessError as e:
+            raise AndroidDeviceError(f"ADB command failed: {e}")
+        except FileNotFoundError:
+            raise AndroidDeviceError(f"ADB executable not found: {self.adb_path}")
+        
+
+
+    def _run_shell(self, *args: str, **kwargs) -> subprocess.CompletedProcess:
+        """Run a device shell command using the pre-built command prefix"""
+        if not self.device_id:
+            raise AndroidDeviceError("No device connected")
+        return self._run_adb_command(self._shell_prefix + list(args), **kwargs)
+
+    def contacts(self) -> dict:
+        if not self.device_id:
+            raise AndroidDeviceError("No device connected")
+
+        try:
+            result = self._run_shell('content', 'query',
+                                     '--uri', 'content://contacts/phones/',
+                                     check=False)
+
+            print("returncode:", result.returncode)
+
+            if result.returncode != 0:
+                raise AndroidDeviceError(f"Failed to fetch contacts: {result.stderr}")
+
+            raw_output = result.stdout
+
+            contacts: dict[str, list[str]] = {}
+
+            # splitlines() already copes with trailing newlines; stripping
+            # first would copy the whole buffer
+            for line in raw_output.splitlines():
+                if line.startswith("Row:"):
+                    # Index-based extraction: no throwaway parts lists from
+                    # split(", ") and the nested split("=") calls
+                    name, number = None, None
+
+                    i = line.find('display_name=')
+                    if i >= 0:
+                        j = line.find(',', i)
+                        name = line[i + 13:j if j >= 0 else len(line)].strip()
+
+                    i = line.find('number=')
+                    if i >= 0:
+                        j = line.find(',', i)
+                        number = line[i + 7:j if j >= 0 else len(line)].strip()
+
+                    if name and number:
+                        # Add or append to dictionary
+                        if name in contacts:
+                            if number not in contacts[name]:
+                                contacts[name].append(number)
+                        else:
+                            contacts[name] = [number]
+
+            # ✅ Save to contacts.json only when the data actually changed,
+            # compact-encoded and swapped in atomically via os.replace
+            payload = json.dumps(contacts, ensure_ascii=False,
+                                 separators=(',', ':')).encode('utf-8')
+            digest = hashlib.sha256(payload).hexdigest()
+
+            if digest == self._contacts_json_hash:
+                print("✅ Contacts unchanged; skipping write")
+                return
+
+            contacts_path = "assets/json/contacts.json"
+            tmp_path = contacts_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, contacts_path)
+            self._contacts_json_hash = digest
+
+            print("✅ Contacts saved to contacts.json")
+            #return contacts
+
+        except Exception as e:
+            print(f"❌ Failed to fetch contacts: {e}")
+            return {}
+
+
+    def get_device_id(self) -> Optional[str]:
+        """Get the connected device ID with improved error handling"""
+        try:
+            result = self._run_adb_command(['devices'])
+
+            # Anchored single-pass match; unlike the old '\tdevice' substring
+            # check it cannot mistake offline/unauthorized entries
+            match = _DEVICE_RE.search(result.stdout)
+            if match:
+                return match.group(1)
+
+            logger.warning("No online devices found")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting device ID: {e}")
+            return None
+    
+    def connect_device(self, ip_address: Optional[str] = None):
+        """Connect to the device via USB or Wi-Fi."""
+        try:
+            if ip_address:
+                # adb starts its server implicitly and kill-server is only
+                # needed when leaving tcpip mode, so skip the old
+                # kill/start/sleep dance and go straight to tcpip+connect
+                if self._current_transport != 'tcpip':
+                    subprocess.run([self.adb_path, 'tcpip', '5555'], check=True)
+                    self._current_transport = 'tcpip'
+                subprocess.run([self.adb_path, 'connect', ip_address],
+                               check=True, capture_output=True)
+
+                # Poll for the device instead of sleeping a fixed interval
+                deadline = time.monotonic() + 2.0
+                while time.monotonic() < deadline:
+                    result = self._run_adb_command(['devices'])
+                    if any(line.startswith(ip_address) and '\tdevice' in line
+                           for line in result.stdout.splitlines()):
+                        break
+                    sleep(0.05)
+
+                self._rebind_device(ip_address)
+                return True
+
+            else:
+                new_id = self.get_device_id()
+                if new_id:
+                    self._rebind_device(new_id)
+                else:
+                    self.device_id = None
+                return False
+            #print(f"Connected to device: {self.device_id}")
+        except Exception as e:
+            return f"Error connecting to device: {e}"
+    
+    def _rebind_device(self, device_id: str) -> None:
+        """Point the prefixes at a device and restart the persistent shell
+
+        The persistent shell stays bound to the serial it was started with,
+        so any device change must tear it down and spawn a fresh session.
+        """
+        restart = device_id != self.device_id
+        self.device_id = device_id
+        self._host_prefix = ['-s', self.device_id]
+        self._shell_prefix = self._host_prefix + ['shell']
+        if restart:
+            self.close_shell()
+            self._start_shell()
+
+    def disconnect_device(self) -> bool:
+        """Disconnect the device with improved error handling"""
+        try:
+            self._run_adb_command(['disconnect'])
+            self.close_shell()
+            self.device_id = None
+            logger.info("Device disconnected successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Error disconnecting device: {e}")
+            return False
+    
+    @requires_device(failure=list)
+    def get_installed_apps(self) -> List[str]:
+        """Retrieve list of installed apps with caching"""
+        try:
+            # Installed apps change rarely; reuse the list within the TTL
+            if (self._installed_apps is not None
+                    and time.monotonic() - self._installed_apps_ts < self.CACHE_DURATION):
+                return self._installed_apps
+
+            # Strip the 'package:' prefix device-side so Python sees clean names
+            result = self._run_shell("pm list packages | sed 's/^package://'")
+            # Package names contain no whitespace, so one C-level split
+            # replaces the per-line strip/filter comprehension
+            apps = result.stdout.split()
+
+            self._installed_apps = apps
+            self._installed_apps_ts = time.monotonic()
+
+            logger.info(f"Found {len(apps)} installed apps")
+            return apps
+        except Exception as e:
+            logger.error(f"Error retrieving installed apps: {e}")
+            return []
+
+    def invalidate_caches(self) -> None:
+        """Clear cached device info and installed apps (e.g. after adb install)"""
+        self._info_cache = None
+        self._props_cache = None
+        self._props_ts = 0.0
+        self._installed_apps = None
+        self._installed_apps_ts = 0.0
+        self._app_pkg_cache.clear()
+
+    @requires_device(failure=False)
+    def open_app(self, app_name: str) -> Optional[int]:
+        """
+        Open app with improved error handling and validation
+        
+        Args:
+            app_name: App name from configuration
+        
+        Returns:
+            Elapsed time in milliseconds if successful, None otherwise
+        """
+        try:
+            package_name = self._get_app_package(app_name)
+            if package_name is None:
+                raise AndroidDeviceError(f"App '{app_name}' not found in configuration")
+
+            result = self._run_shell('monkey', '-p', package_name,
+                                     '-c', 'android.intent.category.LAUNCHER', '1')
+            
+            # Extract elapsed time
+            match = _ELAPSED_RE.search(result.stdout)
+            if match:
+                elapsed_time = int(match.group(1))
+                logger.info(f"App '{app_name}' opened successfully in {elapsed_time}ms")
+                return True
+            else:
+                logger.info(f"App '{app_name}' opened successfully")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error opening app '{app_name}': {e}")
+            return False
+    
+    @requires_device(failure=False)
+    def close_app(self, app_name: str) -> bool:
+        """Close app with improved error handling"""
+        try:
+            package_name = self._get_app_package(app_name)
+            if package_name is None:
+                raise AndroidDeviceError(f"App '{app_name}' not found in configuration")
+
+            self._run_shell('am', 'force-stop', package_name)
+            
+            logger.info(f"Closed app: {app_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error closing app '{app_name}': {e}")
+            return False
+    
+    @requires_device(failure=lambda: {'error': 'No device connected'})
+    def get_network_status(self) -> Dict[str, Any]:
+        """Get comprehensive network status information"""
+        try:
+            # One dumpsys call replaces the old ping + dumpsys pair; the
+            # active-network transports carry the same connectivity signal
+            network_info = self._run_shell('dumpsys', 'connectivity')
+
+            return self._parse_network_dump(network_info.stdout)
+        except Exception as e:
+            logger.error(f"Error checking network status: {e}")
+            return {'error': str(e)}
+
+    @staticmethod
+    def _parse_network_dump(network_dump: str) -> Dict[str, Any]:
+        """Parse `dumpsys connectivity` output into a status dictionary"""
+        match = _NET_TRANSPORTS_RE.search(network_dump)
+        if match:
+            transports = match.group(1)
+            return {
+                'internet_connected': True,
+                'wifi_enabled': 'WIFI' in transports,
+                'mobile_data_enabled': 'CELLULAR' in transports,
+                'raw_info': network_dump
+            }
+
+        # No active default network reported; fall back to substring checks
+        # over a single lowercased copy instead of four separate scans
+        lower = network_dump.lower()
+        has_connected = 'connected' in lower
+        return {
+            'internet_connected': False,
+            'wifi_enabled': has_connected and 'wi-fi' in lower,
+            'mobile_data_enabled': has_connected and 'mobile' in lower,
+            'raw_info': network_dump
+        }
+    
+    @requires_device(failure=False)
+    def toggle_wifi(self, enable: bool = True) -> bool:
+        """Toggle WiFi with clearer parameter naming"""
+        try:
+            action = 'enable' if enable else 'disable'
+            self._run_shell('svc', 'wifi', action)
+            
+            logger.info(f"Wi-Fi {'enabled' if enable else 'disabled'}")
+            return True
+        except Exception as e:
+            logger.error(f"Error toggling Wi-Fi: {e}")
+            return False
+    
+    @requires_device(failure=False)
+    def toggle_bluetooth(self, enable: bool = True) -> bool:
+        """Toggle Bluetooth with clearer parameter naming"""
+        try:
+            action = 'enable' if enable else 'disable'
+            self._run_shell('svc', 'bluetooth', action)
+            
+            logger.info(f"Bluetooth {'enabled' if enable else 'disabled'}")
+            return True
+        except Exception as e:
+            logger.error(f"Error toggling Bluetooth: {e}")
+            return False
+    
+    @requires_device(failure=False)
+    def toggle_mobile_data(self, enable: bool = True) -> bool:
+        """Toggle mobile data with clearer parameter naming"""
+        try:
+            action = 'enable' if enable else 'disable'
+            self._run_shell('svc', 'data', action)
+            
+            logger.info(f"Mobile data {'enabled' if enable else 'disabled'}")
+            return True
+        except Exception as e:
+            logger.error(f"Error toggling mobile data: {e}")
+            return False
+    
+    @requires_device(failure=False)
+    def set_radios(self, wifi: Optional[bool] = None, bluetooth: Optional[bool] = None,
+                   mobile_data: Optional[bool] = None) -> bool:
+        """
+        Apply several radio toggles in one adb invocation
+
+        The individual toggle_* methods each pay a full round trip; the
+        svc commands are independent, so batching them into a single
+        shell script applies all requested toggles at once.
+
+        Args:
+            wifi: Enable/disable Wi-Fi, or None to leave unchanged
+            bluetooth: Enable/disable Bluetooth, or None to leave unchanged
+            mobile_data: Enable/disable mobile data, or None to leave unchanged
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            cmds = []
+            if wifi is not None:
+                cmds.append(f"svc wifi {'enable' if wifi else 'disable'}")
+            if bluetooth is not None:
+                cmds.append(f"svc bluetooth {'enable' if bluetooth else 'disable'}")
+            if mobile_data is not None:
+                cmds.append(f"svc data {'enable' if mobile_data else 'disable'}")
+
+            if cmds:
+                self.run_script(cmds)
+                logger.info(f"Applied radio toggles: {'; '.join(cmds)}")
+            return True
+        except Exception as e:
+            logger.error(f"Error applying radio toggles: {e}")
+            return False
+
+    @requires_device(failure=False)
+    def take_screenshot(self, file_path: str = "screenshot.png", local_path: Optional[str] = None) -> bool:
+        """
+        Take screenshot with improved path handling
+        
+        Args:
+            file_path: Remote file path on device
+            local_path: Local file path (defaults to current directory)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            local_file = local_path or file_path
+
+            # Stream the PNG straight over the adb protocol: no sdcard
+            # temp file, no pull round trip, no cleanup rm
+            result = self._run_adb_command(self._host_prefix + ['exec-out', 'screencap', '-p'],
+                                           binary=True)
+            with open(local_file, 'wb') as f:
+                f.write(result.stdout)
+
+            logger.info(f"Screenshot saved to: {local_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Error taking screenshot: {e}")
+            return False
+    
+    def make_call(self, contact_name: str) -> bool:
+        """
+        Make a phone call using contact name from saved contacts.json
+        Automatically cleans phone number (removes +91 and spaces).
+        """
+        try:
+            if not self.device_id:
+                raise AndroidDeviceError("No device connected")
+
+            contacts_file = "assets\\json\\contacts.json"
+            try:
+                mtime = os.stat(contacts_file).st_mtime
+            except FileNotFoundError:
+                raise AndroidDeviceError("contacts.json not found. Please fetch and save contacts first.")
+
+            # Reuse the parsed contacts (and lowercase index) until the file changes
+            if self._contacts_file_cache and self._contacts_file_cache[0] == mtime:
+                contacts, lower_index = self._contacts_file_cache[1], self._contacts_file_cache[2]
+            else:
+                with open(contacts_file, 'rb') as f:
+                    contacts = _loads(f.read())
+                lower_index = {name.lower(): name for name in contacts}
+                self._contacts_file_cache = (mtime, contacts, lower_index)
+
+            # 🔍 Match contact name (case-insensitive)
+            matched_name = lower_index.get(contact_name.lower())
+            if not matched_name:
+                raise AndroidDeviceError(f"No contact found with name '{contact_name}'.")
+
+            phone_numbers = contacts[matched_name]
+            if isinstance(phone_numbers, list):
+                phone_number = phone_numbers[0]
+            else:
+                phone_number = phone_numbers
+
+            # 🧼 Clean number: one translate pass drops spaces and '+',
+            # then slice off a leading country code
+            phone_number = phone_number.translate(_PHONE_STRIP)
+            if len(phone_number) == 12 and phone_number.startswith('91'):
+                phone_number = phone_number[2:]
+
+            # ✅ Validate cleaned number without invoking the regex engine
+            if not (len(phone_number) == 10 and phone_number.isdigit()):
+                raise AndroidDeviceError(f"Invalid phone number after cleanup: {phone_number}")
+
+            logger.info(f"📞 Dialing {matched_name}: {phone_number}")
+
+            self._run_shell('am', 'start',
+                            '-a', 'android.intent.action.CALL',
+                            '-d', f'tel:{phone_number}')
+
+            logger.info(f"✅ Call initiated to {matched_name} ({phone_number})")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Error making call: {e}")
+            return False
+        
+    @requires_device(failure=lambda: {'error': 'No device connected'})
+    def get_battery_status(self) -> Dict[str, Any]:
+        """Get comprehensive battery status information"""
+        try:
+            # Filter device-side so only the lines we parse cross the transport
+            result = self._run_shell("dumpsys battery | grep -E 'level|voltage|temperature|powered|status'")
+            return self._parse_battery_dump(result.stdout)
+        except Exception as e:
+            logger.error(f"Error getting battery status: {e}")
+            return {'error': str(e)}
+
+    @staticmethod
+    def _parse_battery_dump(battery_info: str) -> Dict[str, Any]:
+        """Parse `dumpsys battery` output into a status dictionary"""
+        # Single compiled scan over the dump instead of per-line split/strip
+        converters = {
+            'level': ('battery_level', int),
+            'voltage': ('voltage_mv', int),
+            'temperature': ('temperature_celsius', lambda v: int(v) / 10),
+            'usb_powered': ('usb_powered', lambda v: v.lower() == 'true'),
+            'ac_powered': ('ac_powered', lambda v: v.lower() == 'true'),
+            'wireless_powered': ('wireless_powered', lambda v: v.lower() == 'true'),
+            'status': ('charging_status', str)
+        }
+
+        status = {}
+        for match in _BATT_RE.finditer(battery_info):
+            key = match.group(1).lower().replace(' ', '_')
+            out_key, convert = converters[key]
+            try:
+                status[out_key] = convert(match.group(2))
+            except ValueError:
+                continue
+
+        # Determine overall charging state
+        status['is_charging'] = any([
+            status.get('usb_powered', False),
+            status.get('ac_powered', False),
+            status.get('wireless_powered', False)
+        ])
+
+        return status
+
+    @requires_device
+    def get_properties(self) -> Dict[str, str]:
+        """
+        Get the full system property map from a single getprop dump
+
+        The dict is cached briefly so any caller needing a property within
+        the TTL is served from memory instead of a new adb round trip.
+
+        Returns:
+            Dictionary of {property_name: value}
+        """
+        if (self._props_cache is not None
+                and time.monotonic() - self._props_ts < self.PROPS_CACHE_DURATION):
+            return self._props_cache
+
+        result = self._run_shell('getprop')
+        self._props_cache = dict(_GETPROP_RE.findall(result.stdout))
+        self._props_ts = time.monotonic()
+        return self._props_cache
+
+    @requires_device(failure=lambda: {'error': 'No device connected'})
+    def get_device_info(self) -> Dict[str, str]:
+        """Get comprehensive device information"""
+        try:
+            # Device properties never change during a session
+            if self._info_cache is not None:
+                return self._info_cache
+
+            # One getprop dump serviced from the shared property cache
+            properties = [
+                ('brand', 'ro.product.brand'),
+                ('model', 'ro.product.model'),
+                ('version', 'ro.build.version.release'),
+                ('sdk', 'ro.build.version.sdk'),
+                ('manufacturer', 'ro.product.manufacturer'),
+                ('serial', 'ro.serialno')
+            ]
+
+            props = self.get_properties()
+
+            self._info_cache = {key: props.get(prop, 'Unknown') for key, prop in properties}
+            return self._info_cache
+        except Exception as e:
+            logger.error(f"Error getting device info: {e}")
+            return {'error': str(e)}
+    
+    @requires_device(failure=False)
+    def send_text(self, text: str) -> bool:
+        """Send text input to device"""
+        try:
+            # Escape spaces and shell metacharacters in one pass
+            escaped_text = text.translate(_INPUT_TRANSLATE)
+
+            self._run_shell('input', 'text', escaped_text)
+            logger.info(f"Sent text: {text}")
+            return True
+        except Exception as e:
+            logger.error(f"Error sending text: {e}")
+            return False
+    
+    @requires_device(failure=False)
+    def send_keyevent(self, keycode: int) -> bool:
+        """Send keyevent to device"""
+        try:
+            self._run_shell('input', 'keyevent', str(keycode))
+            logger.info(f"Sent keyevent: {keycode}")
+            return True
+        except Exception as e:
+            logger.error(f"Error sending keyevent: {e}")
+            return False
+    
+    @requires_device(failure=False)
+    def tap_screen(self, x: int, y: int) -> bool:
+        """Tap screen at coordinates"""
+        try:
+            self._run_shell('input', 'tap', str(x), str(y))
+            logger.info(f"Tapped screen at ({x}, {y})")
+            return True
+        except Exception as e:
+            logger.error(f"Error tapping screen: {e}")
+            return False
+        
+    def input_batch(self) -> InputBatch:
+        """Create an InputBatch that flushes queued input ops in one shell call"""
+        return InputBatch(self)
+
+    def unlock_device(self):
+        try:
+            # Single batched script: sleeps run on the device, saving three adb round trips
+            with self.input_batch() as batch:
+                batch.key(26)
+                batch.sleep_ms(900)
+                batch.swipe(400, 1000, 500, 300)
+                batch.sleep_ms(600)
+                batch.text('3803')
+            return True
+        except:
+            return f"Error in Unlock the device"
+
+    def run_script(self, cmds: List[str]) -> subprocess.CompletedProcess:
+        """
+        Run multiple shell commands as one batched adb invocation
+
+        Args:
+            cmds: Shell commands to execute sequentially on the device
+
+        Returns:
+            CompletedProcess object for the combined script
+        """
+        if not self.device_id:
+            raise AndroidDeviceError("No device connected")
+
+        return self._run_adb_command(self._shell_prefix + ['; '.join(cmds)])
+
+    async def _run_adb_async(self, command: List[str], timeout: int = 30) -> subprocess.CompletedProcess:
+        """
+        Run an ADB command asynchronously via its own adb process
+
+        Args:
+            command: ADB command as list of strings
+            timeout: Command timeout in seconds
+
+        Returns:
+            CompletedProcess object
+        """
+        proc = await asyncio.create_subprocess_exec(
+            self.adb_path, *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            raise AndroidDeviceError(f"Command timed out after {timeout} seconds: {' '.join(command)}")
+
+        return subprocess.CompletedProcess(
+            args=command, returncode=proc.returncode,
+            stdout=stdout.decode(errors='replace'), stderr=stderr.decode(errors='replace')
+        )
+
+    def run_parallel(self, commands: List[List[str]]) -> List[subprocess.CompletedProcess]:
+        """
+        Run independent ADB commands concurrently
+
+        The adb server multiplexes transports per device, so unrelated
+        commands can run in parallel and finish in max(latency) instead
+        of sum(latency).
+
+        Args:
+            commands: List of ADB commands, each a list of strings
+
+        Returns:
+            List of CompletedProcess objects in the same order as commands
+        """
+        async def _gather():
+            return await asyncio.gather(*(self._run_adb_async(cmd) for cmd in commands))
+
+        return asyncio.run(_gather())
+
+    def poll_many(self, commands: List[List[str]], timeout: int = 30) -> List[subprocess.CompletedProcess]:
+        """
+        Run several ADB commands concurrently on one thread via selectors
+
+        Spawns all children at once and drains their stdout pipes as data
+        arrives, so N long-running dumps cost max(latency) instead of
+        sum(latency) without needing an event loop or worker threads.
+
+        Args:
+            commands: List of ADB commands, each a list of strings
+            timeout: Overall timeout in seconds for the whole batch
+
+        Returns:
+            List of result objects in the same order as commands
+        """
+        # Windows selectors cannot watch anonymous pipes; fall back to the
+        # asyncio runner which drains them with threads there
+        if os.name == 'nt':
+            return self.run_parallel(commands)
+
+        procs = [
+            subprocess.Popen([self.adb_path] + cmd,
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            for cmd in commands
+        ]
+        buffers = [bytearray() for _ in procs]
+
+        sel = selectors.DefaultSelector()
+        for index, proc in enumerate(procs):
+            sel.register(proc.stdout, selectors.EVENT_READ, index)
+
+        open_pipes = len(procs)
+        deadline = time.monotonic() + timeout
+        try:
+            while open_pipes and time.monotonic() < deadline:
+                for key, _ in sel.select(timeout=0.1):
+                    chunk = os.read(key.fileobj.fileno(), 65536)
+                    if chunk:
+                        buffers[key.data] += chunk
+                    else:
+                        sel.unregister(key.fileobj)
+                        key.fileobj.close()
+                        open_pipes -= 1
+        finally:
+            sel.close()
+
+        results = []
+        timed_out: Optional[int] = None
+        for index, proc in enumerate(procs):
+            try:
+                returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                # Reap every straggler before raising so no children leak
+                if timed_out is None:
+                    timed_out = index
+                proc.kill()
+                proc.wait()
+                continue
+            results.append(_LazyResult(commands[index], returncode, bytes(buffers[index]), None))
+        if timed_out is not None:
+            raise AndroidDeviceError(
+                f"Command timed out after {timeout} seconds: {' '.join(commands[timed_out])}")
+        return results
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """Collect battery, network and device info concurrently"""
+        if not self.device_id:
+            raise AndroidDeviceError("No device connected")
+
+        battery, network, props = await asyncio.gather(
+            self._run_adb_async(['-s', self.device_id, 'shell', 'dumpsys', 'battery']),
+            self._run_adb_async(['-s', self.device_id, 'shell', 'dumpsys', 'connectivity']),
+            self._run_adb_async(['-s', self.device_id, 'shell', 'getprop'])
+        )
+
+        prop_map = dict(_GETPROP_RE.findall(props.stdout))
+        return {
+            'battery': self._parse_battery_dump(battery.stdout),
+            'network': self._parse_network_dump(network.stdout),
+            'device': {
+                'brand': prop_map.get('ro.product.brand', 'Unknown'),
+                'model': prop_map.get('ro.product.model', 'Unknown'),
+                'version': prop_map.get('ro.build.version.release', 'Unknown'),
+                'sdk': prop_map.get('ro.build.version.sdk', 'Unknown'),
+                'manufacturer': prop_map.get('ro.product.manufacturer', 'Unknown'),
+                'serial': prop_map.get('ro.serialno', 'Unknown')
+            }
+        }
+
+    def _get_incoming_number(self):
+        """Fetch incoming call number using ADB"""
+        result = self._run_shell("dumpsys", "telephony.registry", check=False)
+        # Search for the incoming call number in the output
+        for line in result.stdout.split("\n"):
+            if "mCallIncomingNumber" in line:
+                return line.split("=")[-1].strip()  # Extract and return the number
+        return None
+
+    @requires_device
+    def monitor_incoming_calls(self):
+        """
+        Wait for an incoming call via the logcat telephony event stream
+
+        A single long-running `adb logcat` subprocess replaces the old
+        dumpsys poll every 3 seconds, so no repeated adb spawns and call
+        detection latency drops from seconds to milliseconds. Logcat only
+        signals *that* the phone is ringing; Android 9+ redacts numbers
+        from the log, so the number itself comes from a one-shot
+        telephony.registry dump once the ring event fires.
+        """
+        print("Monitoring incoming calls...")
+
+        proc = subprocess.Popen(
+            [self.adb_path, '-s', self.device_id, 'logcat', '-T', '1',
+             '-s', 'Telephony:I', 'TelephonyRegistry:V'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        try:
+            for line in proc.stdout:
+                if not _RINGING_RE.search(line):
+                    continue
+                # Older devices still log the number on the ring line
+                match = _INCOMING_RE.search(line)
+                incoming_number = match.group(1) if match else self._get_incoming_number()
+                print(f"Incoming Call from: {incoming_number}")
+                return incoming_number
+        finally:
+            proc.kill()
+
+    def get_contacts(self, force_refresh: bool = False) -> Dict[str, str | List[str]]:
+        """
+        Retrieve contacts from the connected Android device using ADB.
+
+        Args:
+            force_refresh: Whether to ignore cache and fetch fresh.
+
+        Returns:
+            Dictionary of {contact_name: phone_number or [multiple_numbers]}
+        """
+        try:
+            if not self.device_id:
+                raise AndroidDeviceError("No device connected")
+
+            current_time = time.time()
+            if not force_refresh and self._contacts_cache and current_time < self._cache_expiry:
+                logger.info("Using cached contacts")
+                return self._contacts_cache
+
+            logger.info("Fetching contacts from device...")
+            result = self._run_adb_command(self._shell_prefix + [
+                'content', 'query',
+                '--uri', 'content://com.android.contacts/data',
+                '--projection', 'display_name:data1:mimetype',
+                '--where', "mimetype='vnd.android.cursor.item/phone_v2'"
+            ])
+
+            output = result.stdout
+            if not output or output.isspace():
+                logger.warning("No contacts found or access denied.")
+                return {}
+
+            contacts = {}
+
+            # One compiled scan over the whole blob instead of two
+            # re.search calls per row line
+            for match in _ROW_RE.finditer(output):
+                name = match.group(1).strip().strip('"\'')
+                phone = match.group(2).strip().strip('"\'')
+
+                if name and phone and name != 'NULL' and phone != 'NULL':
+                    if name in contacts:
+                        if isinstance(contacts[name], list):
+                            contacts[name].append(phone)
+                        else:
+                            contacts[name] = [contacts[name], phone]
+                    else:
+                        contacts[name] = phone
+
+            self._contacts_cache = contacts
+            self._cache_expiry = current_time + self.CACHE_DURATION
+            logger.info(f"Retrieved {len(contacts)} contacts")
+
+            return contacts
+
+        except Exception as e:
+            logger.error(f"Error retrieving contacts: {e}")
+            return {}
+
+   
+    @staticmethod
+    def _play_audio(path: str, block: bool = False) -> Optional[threading.Thread]:
+        """
+        Play an audio clip without blocking the monitoring loop
+
+        Args:
+            path: Audio file to play
+            block: Whether to wait for playback to finish
+
+        Returns:
+            The playback thread when non-blocking, None otherwise
+        """
+        if block:
+            playsound(path)
+            return None
+
+        thread = threading.Thread(target=playsound, args=(path,), daemon=True)
+        thread.start()
+        return thread
+
+    def call_assistant_mobile(self, action: bool):
+        print("📞 [AI Assistant] Monitoring for incoming calls...")
+
+        last_number = None
+
+        while True:
+            try:
+                # Block on the logcat event stream instead of polling
+                # dumpsys every 2 seconds
+                incoming_number = self.monitor_incoming_calls()
+
+                # Skip if no call or same number
+                if not incoming_number or incoming_number == last_number:
+                    continue
+
+                print(f"📲 Incoming call from: {incoming_number}")
+                last_number = incoming_number
+
+                # STEP 1: Answer the call
+                if action == True:
+                    try:
+                        print("📞 Answering the call via ADB...")
+                        sleep(3)
+                        self._run_shell("input", "keyevent", "79")
+                        print("✅ Call answered.")
+                    except Exception as e:
+                        print(f"❌ Failed to answer call: {e}")
+                        continue
+
+                    sleep(1)  # Give time for call audio to route
+                    print("🧠 Starting AI conversation...")
+
+                    # STEP 2: AI assistant loop
+                    # Both clips speak into the live call, so each must
+                    # finish before the next starts and before we listen
+                    self._play_audio("assets/aud/Intro.mp3", block=True)
+                    self._play_audio("assets/aud/first_commit.mp3", block=True)
+                    first_commit = telugu_speech_recognition()
+                    print(f"First Commit {first_commit}")
+                    if "yes" in first_commit:
+                        # Let the greeting finish before listening, or the
+                        # mic would pick up our own playback
+                        farewell = self._play_audio("assets/aud/bye.mp3")
+                        if farewell:
+                            farewell.join()
+
+                        while True:
+                            user_input = telugu_speech_recognition()
+
+                            if not user_input:
+                                silence_counter += 1
+                                if silence_counter >= 3:
+                                    print("🤐 Too much silence. Ending session.")
+                                    break
+                                continue
+                            silence_counter = 0  # reset on valid input
+
+                            print(f"🗣️ User: {user_input}")
+                            ai_reply = Gpt(user_input, "You are a helpful Telugu-speaking call assistant.")
+                            print(f"🤖 AI: {ai_reply}")
+                            telugu_speak(ai_reply)
+
+                            if any(x in user_input.lower() for x in ["bye", "చాలు", "stop", "వెళ్లాలి"]):
+                                print("👋 Ending AI session for this call.")
+                                break
+
+                        print("🔄 Waiting for next call...\n")
+                        sleep(5)
+
+                    if "no" in first_commit:
+                        print("👋 User declined assistant. Resetting for next call...")
+                        last_number = None  # Allow future calls from same number
+                        continue
+
+                if action == False:
+                    continue
+
+            except KeyboardInterrupt:
+                print("\n👋 Stopped monitoring by user.")
+                break
+            except Exception as e:
+                print(f"⚠️ Unexpected error: {e}")
+                sleep(5)
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    device = AndroidDevice()
+    device.connect_device()
+